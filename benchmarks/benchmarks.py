@@ -0,0 +1,94 @@
+"""
+Benchmarks of roughsets_base for airspeed velocity (asv): https://asv.readthedocs.io/
+
+Run from the root folder of the repository:
+asv run
+"""
+
+import numpy as np
+import pandas as pd
+
+from roughsets_base.roughset_dt import RoughSetDT
+
+
+def get_dataset(rows_count, columns_count=10, values_count=10, seed=0):
+    rng = np.random.default_rng(seed)
+    X = pd.DataFrame({
+        f"a{column}": rng.integers(0, values_count, rows_count) for column in range(columns_count)
+    })
+    y = pd.Series(rng.integers(0, 3, rows_count), name="target")
+    return X, y
+
+
+class Import:
+    """Import time is measured in a fresh interpreter"""
+
+    def timeraw_import_roughsets_base(self):
+        return "import roughsets_base"
+
+    def timeraw_import_roughset_dt(self):
+        return "from roughsets_base import RoughSetDT"
+
+
+class Construction:
+    params = [[10000, 1000000], [True, False]]
+    param_names = ["rows_count", "validate"]
+
+    def setup(self, rows_count, validate):
+        self.X, self.y = get_dataset(rows_count)
+
+    def time_construct(self, rows_count, validate):
+        RoughSetDT(self.X, self.y, validate=validate)
+
+    def time_construct_and_prepare(self, rows_count, validate):
+        RoughSetDT(self.X, self.y, validate=validate, prepare=True)
+
+    def peakmem_construct_and_prepare(self, rows_count, validate):
+        RoughSetDT(self.X, self.y, validate=validate, prepare=True)
+
+
+class FirstQuery:
+    """Query of an object without prepared codes, like in short-lived processes"""
+
+    params = [[10000, 1000000]]
+    param_names = ["rows_count"]
+
+    def setup(self, rows_count):
+        self.X, self.y = get_dataset(rows_count, columns_count=40)
+
+    def time_get_approximation_indices(self, rows_count):
+        RoughSetDT(self.X, self.y).get_approximation_indices(subset=["a0", "a1"])
+
+    def peakmem_get_approximation_indices(self, rows_count):
+        RoughSetDT(self.X, self.y).get_approximation_indices(subset=["a0", "a1"])
+
+
+class Approximations:
+    params = [[10000, 1000000]]
+    param_names = ["rows_count"]
+
+    def setup(self, rows_count):
+        X, y = get_dataset(rows_count)
+        self.rough_set = RoughSetDT(X, y, prepare=True)
+        self.subset = ["a0", "a1", "a2"]
+
+    def time_get_indiscernibility_relations(self, rows_count):
+        self.rough_set.get_indiscernibility_relations(subset=self.subset)
+
+    def time_get_indiscernibility_index(self, rows_count):
+        self.rough_set.get_indiscernibility_index(subset=self.subset)
+
+    def time_get_approximation_indices(self, rows_count):
+        self.rough_set.get_approximation_indices(subset=self.subset)
+
+    def time_get_dependency_degree(self, rows_count):
+        self.rough_set.get_dependency_degree(subset=self.subset)
+
+    def time_get_approximation_estimates(self, rows_count):
+        self.rough_set.get_approximation_estimates(subset=self.subset, sample_size=0.05, random_state=0)
+
+    def time_get_decision_rules(self, rows_count):
+        self.rough_set.get_decision_rules(subset=self.subset)
+
+    def time_get_reduct(self, rows_count):
+        self.rough_set.get_reduct(subset=self.subset)
@@ -1,9 +1,36 @@
 """
 
+Submodules (and pandas) are imported lazily, when a submodule or a class is used for the first time.
 """
 
-from roughsets_base.roughset_si import RoughSetSI
-from roughsets_base.roughset_dt import RoughSetDT
+import importlib
+
+__all__ = ["RoughSetSI", "RoughSetDT", "RoughSetMDT", "RoughSetBootstrap"]
+
+_SUBMODULES = ["roughset_si", "roughset_dt", "roughset_mdt", "roughset_bootstrap"]
+
+_CLASSES = {
+    "RoughSetSI": "roughset_si",
+    "RoughSetDT": "roughset_dt",
+    "RoughSetMDT": "roughset_mdt",
+    "RoughSetBootstrap": "roughset_bootstrap",
+}
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+
+    if name in _CLASSES:
+        value = getattr(importlib.import_module(f"{__name__}.{_CLASSES[name]}"), name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_SUBMODULES))
 
 
 def setup():
@@ -0,0 +1,186 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+from pandas import DataFrame, Series
+
+from roughsets_base.roughset_dt import RoughSetDT, _get_reduct
+
+# Context of a pool worker process, set once by _init_worker, so codes are not sent with each replicate.
+# It is used only by worker processes, replicates computed in the current process get their own context.
+_worker_data: dict = {}
+
+
+def _get_context(codes: np.ndarray, y_codes: np.ndarray, cache_size: int) -> dict:
+    """Get data shared by replicates: codes and cache of indices of indiscernibility relations"""
+    return {"codes": codes, "y_codes": y_codes, "ind_index_cache": {}, "cache_size": cache_size}
+
+
+def _init_worker(codes: np.ndarray, y_codes: np.ndarray, cache_size: int):
+    _worker_data.update(_get_context(codes, y_codes, cache_size))
+
+
+def _get_weights(rows_count: int, method: str, seed: np.random.SeedSequence, fold: int, folds_count: int) -> np.ndarray:
+    """
+    Get weights of objects for one replicate:
+    bootstrap - number of copies of each object in a sample drawn with replacement,
+    cross_validation - 1 for objects of training folds, 0 for objects of the test fold.
+    """
+    rng = np.random.default_rng(seed)
+    if method == "bootstrap":
+        return np.bincount(rng.integers(0, rows_count, rows_count), minlength=rows_count).astype(np.float64)
+
+    folds = rng.permutation(rows_count) % folds_count
+    return (folds != fold).astype(np.float64)
+
+
+def _run_replicate(replicate: int, method: str, seed: np.random.SeedSequence, folds_count: int, context: dict = None):
+    if context is None:
+        context = _worker_data
+
+    codes, y_codes = context["codes"], context["y_codes"]
+    weights = _get_weights(len(y_codes), method, seed, replicate, folds_count)
+
+    reduct, dependency = _get_reduct(codes, y_codes, weights, context["ind_index_cache"], context["cache_size"])
+    return replicate, reduct, dependency
+
+
+class RoughSetBootstrap:
+    """Class to evaluate stability of reducts and degrees of dependency of a decision table (DT).
+
+    Reducts and degrees of dependency are computed for many resamples of objects of DT
+    (bootstrap or cross-validation). Resamples are represented by weights of objects
+    and all of them share integer codes of X and y, so DataFrames are not copied.
+
+    """
+
+    def __init__(self, rough_set: RoughSetDT, subset=None):
+        """Initialize object of class RoughSetBootstrap
+
+        Parameters
+        ----------
+
+        rough_set: RoughSetDT
+            Decision table
+        subset: column label or sequence of labels, optional
+            Attributes to search for reducts, by default use all of the columns.
+        """
+        self.rough_set = rough_set
+        self.positions = rough_set.get_subset_positions(subset)
+        self.columns = rough_set.X.columns[self.positions].tolist()
+
+    def get_replicates(
+            self, replicates_count=100, method="bootstrap", n_jobs=1, random_state=None, cache_size=64
+    ) -> DataFrame:
+        """
+        Compute reducts and degrees of dependency for resamples of objects
+
+        Parameters
+        ----------
+
+        replicates_count: int, default 100
+            Number of bootstrap samples or number of folds of cross-validation (at least 2).
+
+        method: string, default 'bootstrap'
+            'bootstrap' - samples drawn with replacement (weight of object is number of its copies),
+            'cross_validation' - training folds of k-fold cross-validation.
+
+        n_jobs: int or None, default 1
+            Number of worker processes. If 1, replicates are computed in the current process.
+            If None, use the number of processors.
+
+        random_state: int, optional
+            Seed of resamples.
+
+        cache_size: int, default 64
+            Maximal number of indices of indiscernibility relations kept by each process.
+            Indices do not depend on resamples, so they are shared by replicates of the process.
+
+        Returns
+        -------
+        DataFrame with one replicate in each row and columns:
+        replicate, reduct (tuple of column names), reduct_length, dependency (degree of dependency of all attributes)
+        """
+        if method not in ["bootstrap", "cross_validation"]:
+            raise ValueError("method must be one of: 'bootstrap', 'cross_validation'.")
+        if replicates_count < (2 if method == "cross_validation" else 1):
+            raise ValueError("replicates_count must be positive (at least 2 folds for cross_validation).")
+        if n_jobs is None:
+            n_jobs = os.cpu_count() or 1
+        if not isinstance(n_jobs, (int, np.integer)) or n_jobs < 1:
+            raise ValueError("n_jobs must be a positive integer or None.")
+
+        codes = self.rough_set.get_subset_codes(self.columns)
+        y_codes = self.rough_set.get_y_codes()
+        seeds = np.random.SeedSequence(random_state).spawn(replicates_count)
+        if method == "cross_validation":
+            # All folds must use the same permutation of objects
+            seeds = [seeds[0]] * replicates_count
+
+        arguments = (
+            range(replicates_count), [method] * replicates_count, seeds, [replicates_count] * replicates_count
+        )
+        if n_jobs == 1:
+            context = _get_context(codes, y_codes, cache_size)
+            results = list(map(partial(_run_replicate, context=context), *arguments))
+        else:
+            with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker, initargs=(codes, y_codes, cache_size)) as executor:
+                results = list(executor.map(_run_replicate, *arguments, chunksize=max(replicates_count // (4 * n_jobs), 1)))
+
+        return DataFrame({
+            "replicate": [replicate for replicate, _, _ in results],
+            "reduct": [tuple(self.columns[position] for position in sorted(reduct)) for _, reduct, _ in results],
+            "reduct_length": [len(reduct) for _, reduct, _ in results],
+            "dependency": [dependency for _, _, dependency in results],
+        })
+
+    def get_attribute_frequencies(self, replicates: DataFrame) -> Series:
+        """
+        Get fraction of replicates in which each attribute was selected to a reduct
+
+        Parameters
+        ----------
+        replicates: DataFrame
+            Result of get_replicates
+        """
+        counts = Series(0, index=self.columns, name="frequency")
+        for reduct in replicates["reduct"]:
+            counts[list(reduct)] += 1
+
+        return (counts / len(replicates.index)).sort_values(ascending=False, kind="stable")
+
+    def get_reduct_frequencies(self, replicates: DataFrame) -> Series:
+        """
+        Get fraction of replicates in which each reduct was found
+
+        Parameters
+        ----------
+        replicates: DataFrame
+            Result of get_replicates
+        """
+        return replicates["reduct"].value_counts(normalize=True).rename("frequency")
+
+    def get_dependency_confidence_interval(self, replicates: DataFrame, confidence=0.95) -> Series:
+        """
+        Get mean and percentile confidence interval of degrees of dependency of replicates
+
+        Parameters
+        ----------
+        replicates: DataFrame
+            Result of get_replicates
+        confidence: float, default 0.95
+            Confidence level of the interval.
+
+        Returns
+        -------
+        Series with: estimate, lower_bound, upper_bound
+        """
+        dependency = replicates["dependency"]
+        alpha = (1 - confidence) / 2
+
+        return Series({
+            "estimate": dependency.mean(),
+            "lower_bound": dependency.quantile(alpha),
+            "upper_bound": dependency.quantile(1 - alpha),
+        }, name="dependency")
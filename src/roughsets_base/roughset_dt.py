@@ -1,10 +1,113 @@
 import copy
 import logging
+from statistics import NormalDist
 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame, Series
 
-from roughsets_base.roughset_si import RoughSetSI
+from roughsets_base.roughset_si import RoughSetSI, _get_codes, _get_group_index
+
+
+def _get_regions_masks(ind_index: np.ndarray, y_codes: np.ndarray, concept_mask: np.ndarray):
+    """
+    Get boolean masks of objects from lower approximation and boundary region
+
+    Vectorized version of get_approximation_indices, which uses only integer codes:
+    ind_index - index of indiscernibility relation of each object,
+    y_codes - code of decision of each object,
+    concept_mask - whether decision of an object belongs to concepts.
+    """
+    if len(ind_index) == 0:
+        return np.zeros(0, dtype=bool), np.zeros(0, dtype=bool)
+
+    classes_count = int(ind_index.max()) + 1
+
+    # A relation is consistent if all its objects have the same decision (min == max),
+    # it does not need a hash table of pairs (relation, decision).
+    # Missing decisions (code -1) are not counted, like in get_Xy_with_indiscernibility_relations_index,
+    # so a relation with only missing decisions is neither consistent nor inconsistent.
+    known = y_codes >= 0
+    y_min = np.full(classes_count, np.iinfo(np.int64).max, dtype=np.int64)
+    y_max = np.full(classes_count, np.iinfo(np.int64).min, dtype=np.int64)
+    np.minimum.at(y_min, ind_index[known], y_codes[known])
+    np.maximum.at(y_max, ind_index[known], y_codes[known])
+
+    # Indiscernibility relations related to concepts
+    concept_classes = np.zeros(classes_count, dtype=bool)
+    concept_classes[ind_index[concept_mask]] = True
+
+    in_concept = concept_classes[ind_index]
+    consistent = (y_min == y_max)[ind_index]
+    inconsistent = (y_min < y_max)[ind_index]
+
+    return in_concept & consistent, in_concept & inconsistent
+
+
+def _get_weighted_dependency_degree(ind_index: np.ndarray, y_codes: np.ndarray, weights: np.ndarray = None) -> float:
+    """
+    Get degree of dependency where each object has a weight (e.g. number of its copies in a bootstrap sample)
+
+    Objects with weight 0 are not included, so they do not make relations inconsistent.
+    """
+    if weights is not None:
+        selected = weights > 0
+        ind_index, y_codes, weights = ind_index[selected], y_codes[selected], weights[selected]
+
+    if len(ind_index) == 0:
+        return 0.0
+
+    positive, _ = _get_regions_masks(ind_index, y_codes, np.ones(len(ind_index), dtype=bool))
+    if weights is None:
+        return float(positive.mean())
+    return float(weights[positive].sum() / weights.sum())
+
+
+def _get_reduct(
+        codes: np.ndarray, y_codes: np.ndarray, weights: np.ndarray = None, ind_index_cache: dict = None, cache_size=None
+):
+    """
+    Get a reduct of attributes (positions of columns of codes) by a greedy search (QuickReduct)
+
+    Attributes which increase the degree of dependency the most are added until the degree of dependency
+    of all attributes is reached, then redundant attributes are removed.
+    Indices of indiscernibility relations do not depend on weights, so they may be shared by calls
+    in ind_index_cache: tuple of positions -> index (at most cache_size indices, the oldest are removed first).
+
+    Returns
+    -------
+    Tuple: list of positions of attributes, degree of dependency of all attributes
+    """
+    if ind_index_cache is None:
+        ind_index_cache = {}
+
+    def get_dependency_degree(positions):
+        key = tuple(sorted(positions))
+        if key not in ind_index_cache:
+            ind_index_cache[key] = _get_group_index(codes[:, list(key)])
+            while cache_size is not None and len(ind_index_cache) > max(cache_size, 1):
+                del ind_index_cache[next(iter(ind_index_cache))]
+        return _get_weighted_dependency_degree(ind_index_cache[key], y_codes, weights)
+
+    all_positions = list(range(codes.shape[1]))
+    full_dependency = get_dependency_degree(all_positions)
+
+    reduct = []
+    dependency = get_dependency_degree(reduct)
+    tolerance = 1e-12  # weighted degrees are sums of floats
+    while dependency < full_dependency - tolerance and len(reduct) < len(all_positions):
+        candidates = [position for position in all_positions if position not in reduct]
+        dependencies = [get_dependency_degree(reduct + [position]) for position in candidates]
+        best = int(np.argmax(dependencies))
+        reduct.append(candidates[best])
+        dependency = dependencies[best]
+
+    for position in list(reduct):
+        reduced = [other for other in reduct if other != position]
+        if get_dependency_degree(reduced) >= full_dependency - tolerance:
+            reduct = reduced
+
+    return reduct, full_dependency
 
 
 class RoughSetDT(RoughSetSI):
@@ -19,7 +122,7 @@ class RoughSetDT(RoughSetSI):
 
     """
 
-    def __init__(self, X: DataFrame, y: Series = None, ind_index_name="IND_INDEX"):
+    def __init__(self, X: DataFrame, y: Series = None, ind_index_name="IND_INDEX", validate=True, prepare=False):
         """Initialize object of class RoughSet
 
         Parameters
@@ -32,6 +135,12 @@ class RoughSetDT(RoughSetSI):
         ind_index_name: string, default 'IND_INDEX'
             Name of a special column to store index of discernibilty relation,
             computed by the function: get_indiscernibility_relations function.
+        validate: bool, default True
+            Whether to check types and sizes of X and y. Use False to save time
+            when the data is already known to be correct.
+        prepare: bool, default False
+            Whether to compute integer codes of X and y at once (see: get_codes, get_y_codes),
+            instead of the first computation which needs them.
 
         Note: X and y are computed as data structures with nominal values.
 
@@ -40,28 +149,26 @@ class RoughSetDT(RoughSetSI):
         pandas array: https://pandas.pydata.org/docs/reference/arrays.html
         """
 
-        super().__init__(X, ind_index_name)
+        super().__init__(X, ind_index_name, validate=validate, prepare=prepare)
+
+        self.__y_codes: np.ndarray = None  # y as a vector of integer codes, see: get_y_codes
 
         self.default_class_attr = "target"
 
         if isinstance(y, list):
             y = pd.Series(y, name=self.default_class_attr)
 
-        self.__assert_X_y(X, y)
+        if validate:
+            self.__assert_X_y(X, y)
         self.y = y
 
-        if self.ind_rel_column_index_name in self.X.columns:
-            raise ValueError(f"You can not use {self.ind_rel_column_index_name} as a column name.")
-
-        self.ind_index_name = ind_index_name  # nazwa kolumny pomocniczej dla relacji nieodróżnialności
+        if prepare:
+            self.get_y_codes()
 
     def __assert_X_y(self, X, y):
         if not isinstance(y, Series):
             raise Exception("y must be a type of list or Pandas Series. See more: https://pandas.pydata.org/docs/reference/api/pandas.Series.html")
 
-        if not isinstance(X, DataFrame):
-            raise Exception("X must be a type of Pandas DataFrame. See more: https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.html")
-
         if not len(X.index) == len(y.index):
             raise Exception("Number of objects in X does not match number of decisions in y.")
 
@@ -117,7 +224,7 @@ class RoughSetDT(RoughSetSI):
 
         return X_IND, y_IND, IND_OF_X
 
-    def get_approximation_indices(self, concepts=None, subset=None):
+    def get_approximation_indices(self, concepts=None, subset=None, ind_index=None):
         """
         Get Pandas DataFrame indices which describe approximations boundaries.
 
@@ -131,6 +238,10 @@ class RoughSetDT(RoughSetSI):
             Only consider certain columns for identifying duplicates,
             by default use all of the columns.
 
+        ind_index: array, optional
+            Precomputed index of indiscernibility relation of each object
+            (e.g. by get_indiscernibility_index_out_of_core), then subset is not used.
+
         Returns
         -------
         Tuple: positive_region_of_X, boundary_region_of_X, upper_approximation_of_X, negative_region_of_X
@@ -144,53 +255,338 @@ class RoughSetDT(RoughSetSI):
         if not isinstance(concepts, Series):
             concepts = pd.Series(concepts)
 
-        # IND_OF_X_EXT - indiscernibilty relations (extended with columns: y_class_count and <self.ind_index_name>)
-        X_IND, y_IND, IND_OF_X_EXT = self.get_Xy_with_indiscernibility_relations_index(
-            subset=subset
+        # Index of indiscernibilty relation of each object (computed from codes of X,
+        # so it is shared by all queries when the object is frozen)
+        ind_index = self._get_ind_index(subset, ind_index)
+        concept_mask = self.y.isin(concepts).to_numpy()
+
+        # Get a lower approximation (if only one concept) or sum of lower approximations (if more than one concept)
+        # and a boundary region as masks of objects of X
+        lower_approximation_mask, boundary_region_mask = _get_regions_masks(
+            ind_index, self.get_y_codes(), concept_mask
         )
 
-        # Get indexes of indiscernibilty relations, related to concepts
-        IND_concept = y_IND[
-            y_IND[self.y.name].isin(concepts)
-        ][self.ind_index_name].drop_duplicates()
+        # Get DataFrame's indexes of dataset X
+        lower_approximation_of_X = self.X.index[lower_approximation_mask]
+        boundary_region_of_X = self.X.index[boundary_region_mask]
 
-        # Get indexes of IND_OF_X_EXT which belong to concept
-        IND_OF_X_by_concept = IND_OF_X_EXT[IND_OF_X_EXT[self.ind_index_name].isin(IND_concept)]
+        # Get a upper approximation (if only one concept) or sum of upper approximations (if more than one concept)
+        upper_approximation_of_X = self.X.index[lower_approximation_mask | boundary_region_mask]
 
-        # Get a lower approximation (if only one concept) or sum of lower approximations (if more than one concept)
-        # (DataFrame's indexes of dataset X)
-        ind_index_of_lower_approximation: Series = IND_OF_X_by_concept[
-            IND_OF_X_by_concept["y_class_count"] == 1
-        ][self.ind_index_name]
-        lower_approximation_of_X = X_IND[
-            X_IND[self.ind_index_name].isin(ind_index_of_lower_approximation)
-        ].index
-
-        # Get a boundary region (DataFrame's indexes of dataset X)
-        ind_index_of_boundary_region: Series = IND_OF_X_by_concept[
-            IND_OF_X_by_concept["y_class_count"] > 1
-        ][self.ind_index_name]
-        boundary_region_of_X = X_IND[
-            X_IND[self.ind_index_name].isin(ind_index_of_boundary_region)
-        ].index
+        # Get a negative region
+        negative_region_of_X = self.X.index[~(lower_approximation_mask | boundary_region_mask)]
 
-        # Get a upper approximation (if only one concept) or sum of upper approximations (if more than one concept)
-        # (DataFrame's indexes of dataset X)
-        upper_approximation_of_X = lower_approximation_of_X.append(boundary_region_of_X)
+        return lower_approximation_of_X.sort_values(), boundary_region_of_X.sort_values(), upper_approximation_of_X.sort_values(), negative_region_of_X.sort_values()
 
-        # Get a negative region (DataFrame's indexes of dataset X)
-        negative_region_of_X = self.X.index.difference(upper_approximation_of_X)
+    def freeze(self, cache_size=128):
+        """
+        Switch the object to a read-only mode, which is safe for sharing between threads
 
-        # Get a negative region (DataFrame's indexes of dataset X) (method 2)
-        # IND_OF_X_negative_by_concept = IND_OF_X_EXT[
-        #     ~IND_OF_X_EXT[self.ind_index_name].isin(IND_concept)
-        # ]
-        # ind_index_of_negative_region: Series = IND_OF_X_negative_by_concept[self.ind_index_name]
-        # negative_region_of_X = X_IND[
-        #     X_IND[self.ind_index_name].isin(ind_index_of_negative_region)
-        # ].index
+        See: RoughSetSI.freeze. Codes of y are also computed at once and made read-only,
+        so X and y must not be modified after freezing.
+        """
+        self.get_y_codes().flags.writeable = False
+        return super().freeze(cache_size)
 
-        return lower_approximation_of_X.sort_values(), boundary_region_of_X.sort_values(), upper_approximation_of_X.sort_values(), negative_region_of_X.sort_values()
+    def get_y_codes(self) -> np.ndarray:
+        """
+        Get y as a vector of integer codes (missing decisions get code -1)
+
+        The vector is computed once and kept in cache, so y should not be modified later.
+        """
+        if self.__y_codes is None:
+            self.__y_codes = pd.factorize(self.y)[0].astype(np.int64)
+        return self.__y_codes
+
+    def get_dependency_degree(self, subset=None, ind_index=None) -> float:
+        """
+        Get degree of dependency of y on attributes from subset
+
+        gamma = |POS(y)| / |X|, where POS(y) is a sum of lower approximations of all concepts.
+
+        Parameters
+        ----------
+        subset: column label or sequence of labels, optional
+            by default use all of the columns.
+
+        ind_index: array, optional
+            Precomputed index of indiscernibility relation of each object
+            (e.g. by get_indiscernibility_index_out_of_core), then subset is not used.
+        """
+        if self.is_empty:
+            return 0.0
+
+        y_codes = self.get_y_codes()
+        positive, _ = _get_regions_masks(
+            self._get_ind_index(subset, ind_index), y_codes, np.ones(len(y_codes), dtype=bool)
+        )
+        return float(positive.mean())
+
+    def get_reduct(self, subset=None) -> list:
+        """
+        Get a reduct: a minimal subset of attributes with the same degree of dependency as all attributes
+
+        The reduct is found by a greedy search (QuickReduct): attributes which increase
+        the degree of dependency the most are added, then redundant attributes are removed.
+        So the result is a reduct, but not always the shortest one.
+
+        Parameters
+        ----------
+        subset: column label or sequence of labels, optional
+            Attributes to search, by default use all of the columns.
+
+        Returns
+        -------
+        list of column names (in order of subset, not in order of the search)
+        """
+        positions = self.get_subset_positions(subset)
+        reduct, _ = _get_reduct(self.get_subset_codes(subset), self.get_y_codes())
+        return self.X.columns[[positions[position] for position in sorted(reduct)]].tolist()
+
+    def get_approximation_estimates(
+            self, concepts=None, subset=None, sample_size=0.1, confidence=0.95, random_state=None, heavy_count=10
+    ) -> DataFrame:
+        """
+        Estimate sizes of approximations using a sample of indiscernibility relations
+
+        Whole indiscernibility relations are sampled: an object is in the sample if a (salted) hash
+        of its values of subset attributes is below a threshold, so all objects of a sampled relation
+        are in the sample and its consistency is exact. Only the sample is factorized, full X is only hashed.
+        It is intended for cheap screening of attribute subsets before an exact computation
+        with get_approximation_indices or get_dependency_degree.
+
+        Large relations are not sampled but always included: a relation is large if a random sample
+        of objects (four times larger than sample_size) has at least heavy_count of its objects.
+        So under a skewed distribution of relations the sample is larger than sample_size,
+        but large relations do not dominate the variance of the estimates.
+
+        Fractions are estimated by a ratio estimator (objects of a region / objects of the sample, where objects
+        of each sampled small relation are counted 1 / fraction times). Confidence bounds use a normal approximation
+        of its variance for Bernoulli sampling of small relations (clusters of objects),
+        so the coverage is only approximate when a region has only a few small relations
+        or their sizes are still skewed (it may be below confidence for heavy-tailed distributions of relations).
+
+        Parameters
+        ----------
+
+        concepts: list of decisions for which approximations boundaries must be estimated.
+            If None, estimation will be done for all decisions.
+
+        subset: column label or sequence of labels, optional
+            by default use all of the columns.
+
+        sample_size: float or int, default 0.1
+            Expected fraction of objects (float) or number of objects (int) in the sample.
+            It is also a probability of sampling of each small indiscernibility relation.
+
+        confidence: float, default 0.95
+            Confidence level of the bounds.
+
+        random_state: int or numpy Generator, optional
+            Seed of the salt of the hash (different seeds give different samples of relations).
+
+        heavy_count: int, default 10
+            Minimal number of objects of a relation in the random sample of objects,
+            for which the relation is included in the sample exactly (not sampled).
+
+        Returns
+        -------
+        DataFrame with rows: positive_region, boundary_region, dependency
+        and columns: estimate (fraction of objects of X), lower_bound, upper_bound,
+        size (estimated number of objects).
+        If no relation is sampled, estimates are missing and bounds are [0, 1].
+        """
+        rows_count = len(self.y.index)
+        regions = ["positive_region", "boundary_region", "dependency"]
+        columns = ["estimate", "lower_bound", "upper_bound", "size"]
+        if rows_count == 0:
+            return DataFrame(0.0, index=regions, columns=columns)
+
+        if isinstance(sample_size, float):
+            if not 0 < sample_size <= 1:
+                raise ValueError("sample_size as a fraction must be in range (0, 1].")
+            fraction = sample_size
+        else:
+            if sample_size < 1:
+                raise ValueError("sample_size as a number of objects must be positive.")
+            fraction = min(sample_size / rows_count, 1.0)
+
+        if concepts is None or len(concepts) == 0:
+            concepts = self.get_all_concepts()
+
+        # Sample of relations: objects with equal values have equal hashes
+        positions = self.get_subset_positions(subset)
+        if fraction >= 1:
+            sample = np.arange(rows_count)
+            heavy = np.ones(rows_count, dtype=bool)
+        else:
+            rng = np.random.default_rng(random_state)
+            salt = rng.integers(0, 2 ** 63, dtype=np.uint64)
+            hashes = pd.util.hash_pandas_object(self.X.iloc[:, positions], index=False).to_numpy() ^ salt
+
+            # Mix salted hashes (splitmix64 finalizer), so the sample depends on the salt
+            hashes = (hashes ^ (hashes >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+            hashes = (hashes ^ (hashes >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+            hashes = hashes ^ (hashes >> np.uint64(31))
+
+            # Large relations: hashes counted in a random sample of objects
+            pilot = rng.choice(rows_count, rng.binomial(rows_count, min(4 * fraction, 1.0)), replace=False)
+            pilot_hashes, pilot_counts = np.unique(hashes[pilot], return_counts=True)
+            heavy = np.isin(hashes, pilot_hashes[pilot_counts >= heavy_count])
+
+            sample = np.flatnonzero(heavy | (hashes < np.uint64(int(fraction * 2 ** 64))))
+            heavy = heavy[sample]
+
+        if len(sample) == 0:
+            result = DataFrame(np.nan, index=regions, columns=columns)
+            result["lower_bound"], result["upper_bound"] = 0.0, 1.0
+            return result
+
+        # Approximations of the sample (exact for each sampled relation)
+        ind_index = _get_group_index(_get_codes(self.X.iloc[sample, positions]))
+        y_codes = self.get_y_codes()[sample]
+        concept_mask = self.y.iloc[sample].isin(concepts).to_numpy()
+
+        positive, boundary = _get_regions_masks(ind_index, y_codes, concept_mask)
+        dependency, _ = _get_regions_masks(ind_index, y_codes, np.ones(len(sample), dtype=bool))
+
+        # Ratio estimates with linearized variance: small relations are clusters sampled with probability fraction,
+        # large relations are included with probability 1 (all objects of a relation have the same hash)
+        class_sizes = np.bincount(ind_index)
+        class_heavy = np.zeros(len(class_sizes), dtype=bool)
+        class_heavy[ind_index] = heavy
+        weights = np.where(class_heavy, 1.0, 1 / fraction)
+        total = np.sum(weights * class_sizes)
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+
+        result = DataFrame(index=regions, columns=columns, dtype=float)
+        for region, mask in zip(regions, [positive, boundary, dependency]):
+            region_sizes = np.bincount(ind_index, weights=mask, minlength=len(class_sizes))
+            estimate = float(np.sum(weights * region_sizes) / total)
+            residuals = (region_sizes - estimate * class_sizes)[~class_heavy]
+            variance = float((1 - fraction) / fraction ** 2 * np.sum(residuals ** 2) / total ** 2)
+            margin = z * np.sqrt(variance)
+            result.loc[region] = [estimate, max(estimate - margin, 0.0), min(estimate + margin, 1.0), estimate * rows_count]
+
+        return result
+
+    def get_decision_rules(self, subset=None, min_support=1, value_reduction=True) -> DataFrame:
+        """
+        Get decision rules induced from indiscernibility relations
+
+        Every pair (indiscernibility relation, decision) is a rule:
+        a certain rule if the relation belongs to a lower approximation of the decision
+        or a possible rule if the relation belongs to a boundary region.
+        Support, confidence and coverage are computed by counting of integer codes of X and y,
+        so X and y are not filtered for each rule.
+        Objects with a missing decision do not give rules and are not counted in support and confidence.
+
+        Parameters
+        ----------
+
+        subset: column label or sequence of labels, optional
+            Condition attributes, by default use all of the columns.
+
+        min_support: int, default 1
+            Minimal number of objects which match conditions and decision of a rule.
+
+        value_reduction: bool, default True
+            Whether to remove redundant conditions from certain rules.
+            A condition is removed (attributes in order of subset) if objects of X,
+            which match the remaining conditions, still have only one decision.
+
+        Returns
+        -------
+        DataFrame with one rule in each row and columns:
+        condition attributes (values of conditions, a missing value for attributes not used by the rule),
+        conditions (tuple of names of attributes used by the rule, so a condition with a missing value
+        is not confused with an attribute which is not used),
+        decision (name of y), support, confidence, coverage, type ('certain' or 'possible').
+        """
+        positions = self.get_subset_positions(subset)
+        columns = self.X.columns[positions]
+        result_columns = columns.tolist() + ["conditions", self.y.name, "support", "confidence", "coverage", "type"]
+        if self.is_empty:
+            return DataFrame(columns=result_columns)
+
+        codes = self.get_subset_codes(subset)
+        y_codes = self.get_y_codes() + 1  # code 0 is a missing decision
+        decisions_count = int(y_codes.max()) + 1
+        decision_sizes = np.bincount(y_codes, minlength=decisions_count)
+        known = y_codes > 0
+
+        ind_index_cache = {}
+
+        def get_ind_index_with_class_sizes(rule_positions: tuple):
+            """Index of indiscernibility relations of X for attributes (positions of codes), size and count of decisions of each relation
+
+            Objects with missing decisions are not counted (like in get_approximation_indices).
+            """
+            if rule_positions not in ind_index_cache:
+                ind_index = _get_group_index(codes[:, list(rule_positions)])
+                classes_count = int(ind_index.max()) + 1
+                pairs = pd.unique(ind_index[known] * decisions_count + y_codes[known])
+                ind_index_cache[rule_positions] = (
+                    ind_index,
+                    np.bincount(ind_index[known], minlength=classes_count),
+                    np.bincount(pairs // decisions_count, minlength=classes_count)
+                )
+            return ind_index_cache[rule_positions]
+
+        all_positions = tuple(range(len(positions)))
+        ind_index, class_sizes, y_class_count = get_ind_index_with_class_sizes(all_positions)
+
+        # Rules: distinct pairs of (indiscernibility relation, decision), represented by their first object
+        rule_index = pd.factorize(ind_index * decisions_count + y_codes)[0]
+        first_rows = np.unique(rule_index, return_index=True)[1]
+        support = np.bincount(rule_index)
+        rule_classes = ind_index[first_rows]
+        known_rules = y_codes[first_rows] > 0  # rules with a missing decision are not candidates
+        certain = known_rules & (y_class_count[rule_classes] == 1)
+        conditions = np.ones((len(first_rows), len(positions)), dtype=bool)
+
+        if value_reduction:
+            certain_rules = np.flatnonzero(certain)
+            for position in all_positions:
+                candidates = certain_rules[conditions[certain_rules, position]]
+                if len(candidates) == 0:
+                    continue
+
+                # Rules with the same remaining conditions are checked together
+                patterns = conditions[candidates]
+                patterns[:, position] = False
+                pattern_index = _get_group_index(patterns)
+                for pattern_id in range(int(pattern_index.max()) + 1):
+                    pattern_rules = candidates[pattern_index == pattern_id]
+                    rule_positions = tuple(np.flatnonzero(conditions[pattern_rules[0]] & (np.arange(len(positions)) != position)))
+                    reduced_ind_index, _, reduced_y_class_count = get_ind_index_with_class_sizes(rule_positions)
+                    consistent = reduced_y_class_count[reduced_ind_index[first_rows[pattern_rules]]] == 1
+                    conditions[pattern_rules[consistent], position] = False
+
+            # Support of reduced rules: all objects which match the remaining conditions
+            pattern_index = _get_group_index(conditions[certain_rules])
+            for pattern_id in range(int(pattern_index.max()) + 1 if len(certain_rules) else 0):
+                pattern_rules = certain_rules[pattern_index == pattern_id]
+                rule_positions = tuple(np.flatnonzero(conditions[pattern_rules[0]]))
+                reduced_ind_index, reduced_class_sizes, _ = get_ind_index_with_class_sizes(rule_positions)
+                support[pattern_rules] = reduced_class_sizes[reduced_ind_index[first_rows[pattern_rules]]]
+
+        # Reduced rules may be equal (relations which differ only in removed conditions), keep first of them
+        reduced_codes = np.column_stack([np.where(conditions, codes[first_rows] + 1, -1), y_codes[first_rows]])
+        distinct_rules = np.sort(np.unique(_get_group_index(reduced_codes), return_index=True)[1])
+        selected = distinct_rules[known_rules[distinct_rules] & (support[distinct_rules] >= min_support)]
+        selected = np.concatenate([selected[certain[selected]], selected[~certain[selected]]])
+
+        rows = first_rows[selected]
+        rules = self.X.iloc[rows, positions].reset_index(drop=True).where(conditions[selected])
+        rules["conditions"] = [tuple(columns[rule_conditions]) for rule_conditions in conditions[selected]]
+        rules[self.y.name] = self.y.iloc[rows].to_numpy()
+        rules["support"] = support[selected]
+        rules["confidence"] = np.where(certain[selected], 1.0, support[selected] / class_sizes[rule_classes[selected]])
+        rules["coverage"] = support[selected] / decision_sizes[y_codes[rows]]
+        rules["type"] = np.where(certain[selected], "certain", "possible")
+
+        return rules
 
     def get_approximation_objects(self, approximation_indices) -> (DataFrame, Series):
         """
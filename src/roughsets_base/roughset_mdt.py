@@ -0,0 +1,198 @@
+import numpy as np
+from pandas import DataFrame, Series
+
+from roughsets_base.roughset_si import RoughSetSI, _get_codes
+from roughsets_base.roughset_dt import RoughSetDT, _get_regions_masks
+
+
+class RoughSetMDT(RoughSetSI):
+    """Class RoughSet to model a decision table with multiple decisions (MDT).
+
+    MDT = f(X, A, Y),
+
+    where:
+    X - objects of universe,
+    A - attributes describing objects of X,
+    Y - decision attributes related to X (one column of Y for each decision).
+
+    Indiscernibility relations of X are computed once and shared by all decisions.
+
+    """
+
+    def __init__(self, X: DataFrame, Y: DataFrame, ind_index_name="IND_INDEX", validate=True, prepare=False):
+        """Initialize object of class RoughSet
+
+        Parameters
+        ----------
+
+        X: DataFrame
+            Objects of universe of type: pandas DataFrame
+        Y: DataFrame
+            Decisions related to X, one column for each decision attribute (target)
+        ind_index_name: string, default 'IND_INDEX'
+            Name of a special column to store index of discernibilty relation,
+            computed by the function: get_indiscernibility_relations function.
+        validate: bool, default True
+            Whether to check types and sizes of X and Y.
+        prepare: bool, default False
+            Whether to compute integer codes of X and Y at once (see: get_codes, get_Y_codes).
+
+        Note: X and Y are computed as data structures with nominal values.
+        """
+
+        super().__init__(X, ind_index_name, validate=validate, prepare=prepare)
+
+        if validate:
+            self.__assert_X_Y(X, Y)
+        self.Y = Y
+
+        self.__Y_codes: np.ndarray = None  # Y as a matrix of integer codes, see: get_Y_codes
+
+        if prepare:
+            self.get_Y_codes()
+
+    def __assert_X_Y(self, X, Y):
+        if not isinstance(Y, DataFrame):
+            raise Exception("Y must be a type of Pandas DataFrame. See more: https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.html")
+
+        if not len(X.index) == len(Y.index):
+            raise Exception("Number of objects in X does not match number of decisions in Y.")
+
+    @property
+    def targets(self) -> list:
+        """Get names of decision attributes"""
+        return self.Y.columns.values.tolist()
+
+    def freeze(self, cache_size=128):
+        """
+        Switch the object to a read-only mode, which is safe for sharing between threads
+
+        See: RoughSetSI.freeze. Codes of Y are also computed at once and made read-only,
+        so X and Y must not be modified after freezing.
+        """
+        self.get_Y_codes().flags.writeable = False
+        return super().freeze(cache_size)
+
+    def get_Y_codes(self) -> np.ndarray:
+        """
+        Get Y as a matrix of integer codes (missing decisions get code -1)
+
+        The matrix is computed once and kept in cache, so Y should not be modified later.
+        """
+        if self.__Y_codes is None:
+            self.__Y_codes = _get_codes(self.Y)
+        return self.__Y_codes
+
+    def get_decision_table(self, target) -> RoughSetDT:
+        """
+        Get decision table (DT) of X and one decision attribute
+        """
+        return RoughSetDT(self.X, self.Y[target], ind_index_name=self.ind_index_name)
+
+    def get_contingency_tables(self, subset=None, ind_index=None) -> dict:
+        """
+        Get contingency tables of indiscernibility relations and decisions
+
+        Parameters
+        ----------
+        subset: column label or sequence of labels, optional
+            Only consider certain columns for identifying duplicates,
+            by default use all of the columns.
+
+        ind_index: array, optional
+            Precomputed index of indiscernibility relation of each object
+            (e.g. by get_indiscernibility_index_out_of_core), then subset is not used.
+
+        Returns
+        -------
+        dict: target -> DataFrame with number of objects for each index of indiscernibility relation (rows)
+        and decision (columns)
+        """
+        ind_index = self._get_ind_index(subset, ind_index)
+
+        tables = {}
+        for target in self.targets:
+            IND_y = DataFrame({self.ind_index_name: ind_index, target: self.Y[target].to_numpy()})
+            tables[target] = IND_y.groupby(
+                [self.ind_index_name, target], sort=False, dropna=False
+            ).size().unstack(fill_value=0).sort_index()
+
+        return tables
+
+    def get_approximation_indices(self, concepts=None, subset=None, ind_index=None) -> dict:
+        """
+        Get Pandas DataFrame indices which describe approximations boundaries for each decision attribute.
+
+        Parameters
+        ----------
+
+        concepts: dict: target -> list of decisions for which approximations boundaries must be evaluated.
+            If None (or target is missing), computation will be done for all decisions.
+
+        subset: column label or sequence of labels, optional
+            Only consider certain columns for identifying duplicates,
+            by default use all of the columns.
+
+        ind_index: array, optional
+            Precomputed index of indiscernibility relation of each object
+            (e.g. by get_indiscernibility_index_out_of_core), then subset is not used.
+
+        Returns
+        -------
+        dict: target -> Tuple: positive_region_of_X, boundary_region_of_X, upper_approximation_of_X, negative_region_of_X
+        """
+        if concepts is None:
+            concepts = {}
+
+        ind_index = self._get_ind_index(subset, ind_index)
+        Y_codes = self.get_Y_codes()
+
+        approximations = {}
+        for position, target in enumerate(self.targets):
+            target_concepts = concepts.get(target)
+            if target_concepts is None or len(target_concepts) == 0:
+                concept_mask = np.ones(len(ind_index), dtype=bool)
+            else:
+                concept_mask = self.Y[target].isin(target_concepts).to_numpy()
+
+            positive, boundary = _get_regions_masks(ind_index, Y_codes[:, position], concept_mask)
+
+            approximations[target] = (
+                self.X.index[positive].sort_values(),
+                self.X.index[boundary].sort_values(),
+                self.X.index[positive | boundary].sort_values(),
+                self.X.index[~(positive | boundary)].sort_values()
+            )
+
+        return approximations
+
+    def get_dependency_degrees(self, subset=None, ind_index=None) -> Series:
+        """
+        Get degrees of dependency of each decision attribute on attributes from subset
+
+        Parameters
+        ----------
+        subset: column label or sequence of labels, optional
+            by default use all of the columns.
+
+        ind_index: array, optional
+            Precomputed index of indiscernibility relation of each object
+            (e.g. by get_indiscernibility_index_out_of_core), then subset is not used.
+
+        Returns
+        -------
+        Series: degree of dependency for each target
+        """
+        degrees = Series(0.0, index=self.Y.columns, name="dependency")
+        if self.is_empty:
+            return degrees
+
+        ind_index = self._get_ind_index(subset, ind_index)
+        Y_codes = self.get_Y_codes()
+        all_concepts = np.ones(len(ind_index), dtype=bool)
+
+        for position in range(len(self.targets)):
+            positive, _ = _get_regions_masks(ind_index, Y_codes[:, position], all_concepts)
+            degrees.iloc[position] = positive.mean()
+
+        return degrees
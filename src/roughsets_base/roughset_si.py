@@ -1,10 +1,48 @@
 import copy
 import logging
-
+import math
+import os
+import pickle
+import tempfile
+import threading
+from concurrent.futures import Future
+
+import numpy as np
 import pandas as pd
 from pandas import DataFrame, Series
 
 
+def _get_codes(X: DataFrame) -> np.ndarray:
+    """Factorize every column of X separately and return codes as a matrix (missing values get code -1)"""
+    codes = np.empty((len(X.index), len(X.columns)), dtype=np.int64)
+    for position in range(len(X.columns)):
+        codes[:, position] = pd.factorize(X.iloc[:, position])[0]
+    return codes
+
+
+def _get_group_index(codes: np.ndarray) -> np.ndarray:
+    """
+    Get index of groups of equal rows of a codes matrix.
+
+    Groups are numbered in order of their first appearance (like drop_duplicates does).
+    Codes of columns are combined into one int64 key, which is compressed
+    by factorization when it could overflow.
+    """
+    rows_count, columns_count = codes.shape
+    if rows_count == 0 or columns_count == 0:
+        return np.zeros(rows_count, dtype=np.int64)
+
+    group_index = codes[:, 0].astype(np.int64) + 1
+    for position in range(1, columns_count):
+        column_codes = codes[:, position].astype(np.int64) + 1
+        radix = int(column_codes.max()) + 1
+        if (int(group_index.max()) + 1) * radix > np.iinfo(np.int64).max:
+            group_index = pd.factorize(group_index)[0].astype(np.int64)
+        group_index = group_index * radix + column_codes
+
+    return pd.factorize(group_index)[0].astype(np.int64)
+
+
 class RoughSetSI:
     """Class RoughSet to model an Information System SI = (X, A).
 
@@ -16,7 +54,7 @@ class RoughSetSI:
 
     """
 
-    def __init__(self, X: DataFrame, ind_index_name="IND_INDEX"):
+    def __init__(self, X: DataFrame, ind_index_name="IND_INDEX", validate=True, prepare=False):
         """Initialize object of class RoughSet
 
         Parameters
@@ -29,6 +67,12 @@ class RoughSetSI:
         ind_index_name: string, default 'IND_INDEX'
             Name of a special column to store index of discernibilty relation,
             computed by the function: get_indiscernibility_relations function.
+        validate: bool, default True
+            Whether to check types and column names of the data. Use False to save time
+            when the data is already known to be correct.
+        prepare: bool, default False
+            Whether to compute integer codes of the data at once (see: get_codes),
+            instead of the first computation which needs them.
 
         Note: X and y are computed as data structures with nominal values.
 
@@ -42,20 +86,34 @@ class RoughSetSI:
         # cache variables
         self.__indiscrenibility_relation: DataFrame = None  # distinct rows of X with ID of IND
         self.__R: DataFrame = None  # R -> X; A row of R has ID from __ind_rel which connect row from X to IND
+        self.__codes: np.ndarray = None  # X as a matrix of integer codes, see: get_codes
+
+        # read-only mode, see: freeze
+        self.__frozen = False
+        self.__ind_index_cache: dict = {}  # positions of subset columns -> Future with index of indiscernibility relations
+        self.__ind_index_cache_size = 0
+        self.__lock = threading.Lock()
 
         self.logger_name = __name__
         self.logger = logging.getLogger(self.logger_name)
 
-        if not isinstance(X, DataFrame):
-            raise Exception("X must be a type of Pandas DataFrame. See more: https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.html")
+        if validate:
+            self.__assert_X(X)
 
         self.X = X
 
-        if self.ind_rel_column_index_name in self.X.columns:
-            raise ValueError(f"You can not use {self.ind_rel_column_index_name} as a column name.")
-
         self.ind_index_name = ind_index_name  # nazwa kolumny pomocniczej dla relacji nieodróżnialności
 
+        if prepare:
+            self.get_codes()
+
+    def __assert_X(self, X):
+        if not isinstance(X, DataFrame):
+            raise Exception("X must be a type of Pandas DataFrame. See more: https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.html")
+
+        if self.ind_rel_column_index_name in X.columns:
+            raise ValueError(f"You can not use {self.ind_rel_column_index_name} as a column name.")
+
     def get_deepcopy(self):
         """Get deepcopy of the object
 
@@ -63,6 +121,50 @@ class RoughSetSI:
         """
         return copy.deepcopy(self)
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_RoughSetSI__lock"] = None
+        state["_RoughSetSI__ind_index_cache"] = {}
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__lock = threading.Lock()
+        if self.__frozen:
+            # Copies of arrays are writeable again
+            self.freeze(self.__ind_index_cache_size)
+
+    def freeze(self, cache_size=128):
+        """
+        Switch the object to a read-only mode, which is safe for sharing between threads
+
+        Codes of X are computed at once and made read-only. Indices of indiscernibility relations
+        (see: get_indiscernibility_index) are kept in cache: when many threads ask for the same subset,
+        it is computed only once and other threads wait for the result.
+        Computations of codes are done mainly by numpy and pandas hash tables, which release the GIL,
+        so queries may be served by a pool of threads.
+
+        X must not be modified after freezing.
+
+        Parameters
+        ----------
+        cache_size: int, default 128
+            Maximal number of indices of indiscernibility relations kept in cache (the oldest are removed first).
+
+        Returns
+        -------
+        The object itself
+        """
+        self.get_codes().flags.writeable = False
+        self.__ind_index_cache_size = cache_size
+        self.__frozen = True
+        return self
+
+    @property
+    def is_frozen(self) -> bool:
+        """Check if the object is in a read-only mode (see: freeze)"""
+        return self.__frozen
+
     def get_X(self) -> DataFrame:
         """
         Get X and y as one DataFrame
@@ -94,6 +196,216 @@ class RoughSetSI:
         result = True if self.__rows_count == 0 else False
         return result
 
+    def get_subset_positions(self, subset=None) -> list:
+        """
+        Get positions of subset columns in X
+
+        Parameters
+        ----------
+        subset: column label or sequence of labels, optional
+            by default use all of the columns.
+        """
+        if subset is None or (not isinstance(subset, str) and len(subset) == 0):
+            return list(range(len(self.X.columns)))
+
+        if isinstance(subset, str):
+            subset = [subset]
+
+        positions = self.X.columns.get_indexer(list(subset))
+        if (positions < 0).any():
+            missing = [column for column, position in zip(subset, positions) if position < 0]
+            raise KeyError(f"Columns not found in X: {missing}")
+
+        return positions.tolist()
+
+    def get_codes(self) -> np.ndarray:
+        """
+        Get X as a matrix of integer codes
+
+        Every column of X is factorized separately, so codes of a column are numbers
+        of its distinct values in order of appearance (missing values get code -1).
+        The matrix is computed once and kept in cache, so X should not be modified later.
+        Functions which need codes of a few columns use get_subset_codes, so the full matrix
+        is built only by this function, freeze or a constructor with prepare=True.
+        """
+        if self.__codes is None:
+            self.__codes = _get_codes(self.X)
+        return self.__codes
+
+    def get_subset_codes(self, subset=None) -> np.ndarray:
+        """
+        Get codes of subset columns of X
+
+        If codes of X are already kept in cache (see: get_codes), they are used.
+        Otherwise only subset columns are factorized and the result is not kept.
+
+        Parameters
+        ----------
+        subset: column label or sequence of labels, optional
+            by default use all of the columns.
+        """
+        return self.__get_codes_of_positions(self.get_subset_positions(subset))
+
+    def __get_codes_of_positions(self, positions: list) -> np.ndarray:
+        if self.__codes is not None:
+            return self.__codes[:, positions]
+        return _get_codes(self.X.iloc[:, positions])
+
+    def get_indiscernibility_index(self, subset=None) -> np.ndarray:
+        """
+        Get index of indiscernibility relation for every object of X
+
+        It is a vectorized equivalent of the column <ind_index_name> computed by
+        get_X_with_indiscernibility_relations_index: indices are numbered in order
+        of first appearance of the objects in X.
+
+        Parameters
+        ----------
+        subset: column label or sequence of labels, optional
+            Only consider certain columns for identifying duplicates,
+            by default use all of the columns.
+
+        Returns
+        -------
+        ndarray of int64 with one index for each object of X
+        (read-only if the object is frozen, see: freeze)
+        """
+        positions = self.get_subset_positions(subset)
+        if not self.__frozen:
+            return _get_group_index(self.__get_codes_of_positions(positions))
+
+        key = tuple(positions)
+        with self.__lock:
+            future = self.__ind_index_cache.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self.__ind_index_cache[key] = future
+                while len(self.__ind_index_cache) > max(self.__ind_index_cache_size, 1):
+                    del self.__ind_index_cache[next(iter(self.__ind_index_cache))]
+
+        if is_owner:
+            try:
+                ind_index = _get_group_index(self.__get_codes_of_positions(positions))
+                ind_index.flags.writeable = False
+                future.set_result(ind_index)
+            except BaseException as err:
+                with self.__lock:
+                    if self.__ind_index_cache.get(key) is future:
+                        del self.__ind_index_cache[key]
+                future.set_exception(err)
+
+        return future.result()
+
+    def _get_ind_index(self, subset=None, ind_index=None) -> np.ndarray:
+        """Get index of indiscernibility relations for subset or check a precomputed one (parameter ind_index)"""
+        if ind_index is None:
+            return self.get_indiscernibility_index(subset)
+
+        if not len(ind_index) == len(self.X.index):
+            raise ValueError("Length of ind_index does not match number of objects in X.")
+        return np.asarray(ind_index, dtype=np.int64)
+
+    def get_indiscernibility_index_out_of_core(
+            self, subset=None, memory_limit=2 ** 28, chunk_size=2 ** 20, directory=None, filename=None
+    ) -> np.memmap:
+        """
+        Get index of indiscernibility relation for every object of X, using disk instead of memory
+
+        It is intended for datasets with a huge number of indiscernibility relations (almost one for each object),
+        when the hash table of get_indiscernibility_relations (or get_indiscernibility_index) does not fit in memory.
+        Chunks of rows of X (subset columns) are hashed and saved to buckets on disk, so equal rows are always
+        in the same bucket. Each bucket is deduplicated separately (values are compared exactly, so collisions
+        of hashes do not merge relations) and the indices are saved to a memory-mapped array.
+        Codes of X (see: get_codes) are not used, so besides X only one chunk and one bucket are kept in memory.
+
+        Note: indices are not numbered in order of first appearance of objects (like in get_indiscernibility_index),
+        but objects have the same index if and only if they are indiscernible.
+        The array can be used by functions which accept parameter ind_index, e.g.: get_approximation_indices.
+
+        Parameters
+        ----------
+        subset: column label or sequence of labels, optional
+            Only consider certain columns for identifying duplicates,
+            by default use all of the columns.
+        memory_limit: int, default 256 MB
+            Approximate number of bytes used for deduplication of one bucket.
+        chunk_size: int, default 2 ** 20
+            Number of rows of X saved into buckets at once.
+        directory: str, optional
+            Directory for temporary bucket files (and the result if filename is None),
+            by default a system temporary directory is used.
+        filename: str, optional
+            File of the result. By default the result is saved to a temporary file,
+            which is removed when the array is released.
+
+        Returns
+        -------
+        memmap of int64 with one index for each object of X
+        """
+        positions = self.get_subset_positions(subset)
+        rows_count = self.__rows_count
+
+        # A memory-mapped file can not be empty, so at least one element is allocated.
+        # The mapping keeps the file open (also the temporary file, which has no name).
+        with (tempfile.TemporaryFile(dir=directory) if filename is None else open(filename, "w+b")) as result_file:
+            result_file.truncate(max(rows_count, 1) * np.dtype(np.int64).itemsize)
+            ind_index = np.memmap(result_file, dtype=np.int64, mode="r+", shape=(rows_count,))
+
+        if rows_count == 0:
+            return ind_index
+
+        # Bytes needed by one row in a bucket: values (estimated from first rows), row number,
+        # codes and work arrays of deduplication
+        head = self.X.iloc[:1000, positions]
+        row_bytes = head.memory_usage(index=False, deep=True).sum() / len(head.index) + (len(positions) + 6) * 8
+        buckets_count = max(math.ceil(rows_count * row_bytes / memory_limit), 1)
+
+        with tempfile.TemporaryDirectory(dir=directory) as buckets_directory:
+            bucket_paths = [os.path.join(buckets_directory, f"bucket_{bucket}.pkl") for bucket in range(buckets_count)]
+
+            # Partition rows into buckets by hash of their values
+            for start in range(0, rows_count, chunk_size):
+                chunk = self.X.iloc[start:start + chunk_size, positions]
+                row_hash = np.zeros(len(chunk.index), dtype=np.uint64)
+                for position in range(len(positions)):
+                    column = chunk.iloc[:, position]
+                    if pd.api.types.is_float_dtype(column.dtype):
+                        column = column + 0.0  # -0.0 and 0.0 are equal values, but have different hashes
+                    row_hash = row_hash * np.uint64(1000003) ^ pd.util.hash_pandas_object(column, index=False).to_numpy()
+
+                buckets = (row_hash % np.uint64(buckets_count)).astype(np.int64)
+                order = np.argsort(buckets, kind="stable")
+                rows = chunk.iloc[order]
+                rows.index = np.arange(start, start + len(chunk.index), dtype=np.int64)[order]
+                bounds = np.concatenate([[0], np.cumsum(np.bincount(buckets, minlength=buckets_count))])
+
+                for bucket in np.flatnonzero(bounds[1:] > bounds[:-1]):
+                    with open(bucket_paths[bucket], "ab") as bucket_file:
+                        pickle.dump(rows.iloc[bounds[bucket]:bounds[bucket + 1]], bucket_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+            # Deduplicate each bucket, indices of buckets are shifted by number of previous indices
+            offset = 0
+            for bucket_path in bucket_paths:
+                if not os.path.exists(bucket_path):
+                    continue
+
+                parts = []
+                with open(bucket_path, "rb") as bucket_file:
+                    while True:
+                        try:
+                            parts.append(pickle.load(bucket_file))
+                        except EOFError:
+                            break
+
+                rows = pd.concat(parts) if len(parts) > 1 else parts[0]
+                bucket_ind_index = _get_group_index(_get_codes(rows))
+                ind_index[rows.index.to_numpy()] = bucket_ind_index + offset
+                offset += int(bucket_ind_index.max()) + 1
+
+        ind_index.flush()
+        return ind_index
+
     def get_indiscernibility_relations(self, subset=None, return_indiscernibility_index: bool = True):
         """
         Compute indiscernibility relations for X DataFrame
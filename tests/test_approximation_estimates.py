@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+
+from roughsets_base.roughset_dt import RoughSetDT
+from tests.abstract.t_roughset import AbstractClasses
+
+
+class TestApproximationEstimates(AbstractClasses.TBase):
+    """
+        Run tests of approximation estimates (and exact dependency degree) for dataset: 3
+
+    """
+
+    def setUp(self):
+        super().setUpDataSet(3)
+
+    def test_get_indiscernibility_index(self):
+        X_IND, IND_OF_X = self.rough_set.get_X_with_indiscernibility_relations_index()
+        ind_index = self.rough_set.get_indiscernibility_index()
+
+        assert (ind_index == X_IND[self.rough_set.ind_index_name].to_numpy()).all()
+
+        X_IND, IND_OF_X = self.rough_set.get_X_with_indiscernibility_relations_index(subset=["A1"])
+        ind_index = self.rough_set.get_indiscernibility_index(subset=["A1"])
+
+        assert (ind_index == X_IND[self.rough_set.ind_index_name].to_numpy()).all()
+
+    def test_get_dependency_degree(self):
+        positive, _, _, _ = self.rough_set.get_approximation_indices()
+
+        assert self.rough_set.get_dependency_degree() == len(positive) / len(self.X.index)
+        assert self.rough_set.get_dependency_degree(subset=["A2"]) == 0.0
+
+    def test_get_approximation_estimates_of_full_sample(self):
+        positive, boundary, _, _ = self.rough_set.get_approximation_indices(concepts=[3])
+        estimates = self.rough_set.get_approximation_estimates(concepts=[3], sample_size=1.0)
+
+        assert len(positive) == 1 and len(boundary) == 2
+        assert estimates.loc["positive_region", "size"] == len(positive)
+        assert estimates.loc["boundary_region", "size"] == len(boundary)
+        assert estimates.loc["dependency", "estimate"] == self.rough_set.get_dependency_degree()
+        # Full sample has no sampling variance
+        assert (estimates["lower_bound"] == estimates["estimate"]).all()
+        assert (estimates["upper_bound"] == estimates["estimate"]).all()
+
+    def test_get_approximation_estimates_of_sample(self):
+        rng = np.random.default_rng(0)
+        X = pd.DataFrame({"a": rng.integers(0, 20000, 100000), "b": rng.integers(0, 5, 100000)})
+        y = pd.Series(((X["a"] % 3 == 0) | (rng.random(100000) < 0.001)).astype(int), name="target")
+        rough_set = RoughSetDT(X, y)
+
+        exact = rough_set.get_dependency_degree(subset=["a"])
+        estimates = rough_set.get_approximation_estimates(subset=["a"], sample_size=20000, random_state=1)
+
+        assert estimates.loc["dependency", "lower_bound"] <= exact <= estimates.loc["dependency", "upper_bound"]
+        assert estimates.loc["dependency", "lower_bound"] <= estimates.loc["dependency", "estimate"]
+        assert estimates.loc["dependency", "estimate"] <= estimates.loc["dependency", "upper_bound"]
+
+        # Different seeds sample different relations
+        other_estimates = rough_set.get_approximation_estimates(subset=["a"], sample_size=20000, random_state=2)
+        assert other_estimates.loc["dependency", "estimate"] != estimates.loc["dependency", "estimate"]
+
+    def test_get_approximation_estimates_of_high_cardinality_attribute(self):
+        # Almost all relations are small, a sample of objects would make them look consistent
+        rng = np.random.default_rng(0)
+        X = pd.DataFrame({"a": rng.integers(0, 100000, 1000000)})
+        y = pd.Series(rng.integers(0, 3, 1000000), name="target")
+        rough_set = RoughSetDT(X, y)
+
+        exact = rough_set.get_dependency_degree()
+        for sample_size in [0.01, 0.1]:
+            estimates = rough_set.get_approximation_estimates(sample_size=sample_size, random_state=1)
+
+            assert estimates.loc["dependency", "lower_bound"] <= exact <= estimates.loc["dependency", "upper_bound"]
+            assert estimates.loc["dependency", "upper_bound"] - estimates.loc["dependency", "lower_bound"] < 0.01
+
+    def test_get_approximation_estimates_of_skewed_attribute(self):
+        # A few large relations have most of the objects, they are included in the sample exactly
+        rng = np.random.default_rng(0)
+        X = pd.DataFrame({"a": rng.zipf(1.5, 100000)})
+        y = pd.Series(np.where(rng.random(100000) < 0.01, rng.integers(0, 3, 100000), X["a"] % 3), name="target")
+        rough_set = RoughSetDT(X, y)
+
+        exact = rough_set.get_dependency_degree()
+        covered = 0
+        for random_state in range(40):
+            estimates = rough_set.get_approximation_estimates(sample_size=0.05, random_state=random_state)
+            covered += estimates.loc["dependency", "lower_bound"] <= exact <= estimates.loc["dependency", "upper_bound"]
+
+        assert covered >= 32
+
+    def test_get_approximation_indices_with_missing_decisions(self):
+        # Missing decisions are not counted as a decision of an indiscernibility relation
+        rough_set = RoughSetDT(pd.DataFrame({"a": [1, 1, 2, 3]}), pd.Series([1.0, np.nan, 2.0, np.nan], name="target"))
+
+        positive, boundary, upper, negative = rough_set.get_approximation_indices()
+
+        assert positive.tolist() == [0, 1, 2]
+        assert boundary.tolist() == []
+        assert negative.tolist() == [3]
+        assert rough_set.get_dependency_degree() == 0.75
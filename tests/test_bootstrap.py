@@ -0,0 +1,97 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from roughsets_base.roughset_bootstrap import RoughSetBootstrap
+from roughsets_base.roughset_dt import RoughSetDT
+from tests.abstract.t_roughset import AbstractClasses
+
+
+class TestBootstrap(AbstractClasses.TBase):
+    """
+        Run tests of reducts and their bootstrap evaluation
+
+    """
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.X = pd.DataFrame({
+            "a": rng.integers(0, 4, 2000),
+            "b": rng.integers(0, 4, 2000),
+            "noise": rng.integers(0, 2, 2000)
+        })
+        self.X["a_copy"] = self.X["a"]
+        self.y = pd.Series((self.X["a"] + self.X["b"]) % 3, name="target")
+
+        self.rough_set = RoughSetDT(self.X, self.y)
+        self.bootstrap = RoughSetBootstrap(self.rough_set)
+
+    def test_get_reduct(self):
+        assert self.rough_set.get_reduct() == ["a", "b"]
+        assert self.rough_set.get_reduct(subset=["noise", "b", "a_copy"]) == ["b", "a_copy"]
+
+        # Attributes are in order of subset, like reducts of replicates
+        reduct = self.rough_set.get_reduct(subset=["b", "noise", "a"])
+        replicates = RoughSetBootstrap(self.rough_set, subset=["b", "noise", "a"]).get_replicates(replicates_count=3, random_state=0)
+        assert reduct == ["b", "a"]
+        assert (replicates["reduct"] == tuple(reduct)).all()
+
+    def test_get_replicates(self):
+        replicates = self.bootstrap.get_replicates(replicates_count=10, random_state=0)
+
+        assert replicates["replicate"].tolist() == list(range(10))
+        assert (replicates["reduct"] == ("a", "b")).all()
+        assert (replicates["dependency"] == 1.0).all()
+
+        frequencies = self.bootstrap.get_attribute_frequencies(replicates)
+        assert frequencies.to_dict() == {"a": 1.0, "b": 1.0, "noise": 0.0, "a_copy": 0.0}
+        assert self.bootstrap.get_reduct_frequencies(replicates)[("a", "b")] == 1.0
+
+    def test_get_replicates_in_processes(self):
+        replicates = self.bootstrap.get_replicates(replicates_count=6, n_jobs=2, random_state=0)
+        true_replicates = self.bootstrap.get_replicates(replicates_count=6, random_state=0)
+
+        assert replicates.equals(true_replicates)
+
+    def test_get_replicates_in_threads(self):
+        other_rough_set = RoughSetDT(self.X, self.y.where(self.X["noise"] == 0, 0))
+        bootstraps = [self.bootstrap, RoughSetBootstrap(other_rough_set)] * 4
+        true_replicates = [bootstrap.get_replicates(replicates_count=5, random_state=0) for bootstrap in bootstraps]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            replicates = list(executor.map(lambda bootstrap: bootstrap.get_replicates(replicates_count=5, random_state=0), bootstraps))
+
+        for result, true_result in zip(replicates, true_replicates):
+            assert result.equals(true_result)
+
+    def test_get_dependency_confidence_interval(self):
+        rough_set = RoughSetDT(self.X, self.y.where(self.X["noise"] == 0, 0))
+        bootstrap = RoughSetBootstrap(rough_set, subset=["a", "noise"])
+
+        replicates = bootstrap.get_replicates(replicates_count=50, random_state=0)
+        interval = bootstrap.get_dependency_confidence_interval(replicates)
+
+        exact = rough_set.get_dependency_degree(subset=["a", "noise"])
+        assert interval["lower_bound"] <= interval["estimate"] <= interval["upper_bound"]
+        assert interval["lower_bound"] <= exact <= interval["upper_bound"]
+
+    def test_cross_validation(self):
+        replicates = self.bootstrap.get_replicates(replicates_count=5, method="cross_validation", random_state=0)
+
+        assert len(replicates.index) == 5
+        assert (replicates["reduct"] == ("a", "b")).all()
+
+    def test_get_replicates_with_wrong_arguments(self):
+        with self.assertRaises(ValueError):
+            self.bootstrap.get_replicates(method="jackknife")
+        with self.assertRaises(ValueError):
+            self.bootstrap.get_replicates(replicates_count=1, method="cross_validation")
+        with self.assertRaises(ValueError):
+            self.bootstrap.get_replicates(replicates_count=0)
+        for n_jobs in [0, -1, 1.5]:
+            with self.assertRaises(ValueError):
+                self.bootstrap.get_replicates(replicates_count=2, n_jobs=n_jobs)
+
+        replicates = self.bootstrap.get_replicates(replicates_count=4, n_jobs=None, random_state=0)
+        assert replicates.equals(self.bootstrap.get_replicates(replicates_count=4, random_state=0))
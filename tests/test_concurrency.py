@@ -0,0 +1,62 @@
+import copy
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from roughsets_base.roughset_dt import RoughSetDT
+from roughsets_base.roughset_mdt import RoughSetMDT
+from tests.abstract.t_roughset import AbstractClasses
+
+
+class TestConcurrency(AbstractClasses.TBase):
+    """
+        Run tests of a frozen (read-only) object shared by threads
+
+    """
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.X = pd.DataFrame({column: rng.integers(0, 10, 100000) for column in ["a", "b", "c"]})
+        self.y = pd.Series(rng.integers(0, 3, 100000), name="target")
+
+        self.rough_set = RoughSetDT(self.X, self.y).freeze()
+
+    def test_freeze(self):
+        assert self.rough_set.is_frozen
+        assert not self.rough_set.get_codes().flags.writeable
+        assert not self.rough_set.get_y_codes().flags.writeable
+        assert not self.rough_set.get_indiscernibility_index(["a"]).flags.writeable
+
+    def test_get_indiscernibility_index_is_computed_once(self):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: self.rough_set.get_indiscernibility_index(["a", "b"]), range(32)))
+
+        assert all(result is results[0] for result in results)
+        assert (results[0] == RoughSetDT(self.X, self.y).get_indiscernibility_index(["a", "b"])).all()
+
+    def test_get_approximation_indices_in_threads(self):
+        subsets = [["a"], ["b"], ["a", "b"], ["a", "b", "c"]] * 4
+        true_approximations = [RoughSetDT(self.X, self.y).get_approximation_indices(subset=subset) for subset in subsets]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            approximations = list(executor.map(lambda subset: self.rough_set.get_approximation_indices(subset=subset), subsets))
+
+        for regions, true_regions in zip(approximations, true_approximations):
+            for region, true_region in zip(regions, true_regions):
+                self.assert_check_eqality_of_2_dataframe_indices(region, true_region)
+
+    def test_copy_of_frozen_object(self):
+        self.rough_set.get_indiscernibility_index(["a"])
+
+        for rough_set in [copy.deepcopy(self.rough_set), pickle.loads(pickle.dumps(self.rough_set))]:
+            assert rough_set.is_frozen
+            assert not rough_set.get_codes().flags.writeable
+            assert not rough_set.get_y_codes().flags.writeable
+            assert (rough_set.get_indiscernibility_index(["a"]) == self.rough_set.get_indiscernibility_index(["a"])).all()
+
+        rough_set = RoughSetMDT(self.X, pd.DataFrame({"y1": self.y, "y2": self.y % 2})).freeze()
+        for rough_set in [copy.deepcopy(rough_set), pickle.loads(pickle.dumps(rough_set))]:
+            assert not rough_set.get_codes().flags.writeable
+            assert not rough_set.get_Y_codes().flags.writeable
@@ -0,0 +1,63 @@
+import os
+import subprocess
+import sys
+
+import pandas as pd
+import pytest
+
+from roughsets_base.roughset_dt import RoughSetDT
+from tests.abstract.t_roughset import AbstractClasses
+
+
+class TestConstruction(AbstractClasses.TBase):
+    """
+        Run tests of import and construction for dataset: 3
+
+    """
+
+    def setUp(self):
+        super().setUpDataSet(3)
+
+    def run_python(self, code):
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        subprocess.run([sys.executable, "-c", code], check=True, env=env)
+
+    def test_import_is_lazy(self):
+        self.run_python(
+            "import sys, roughsets_base; assert 'pandas' not in sys.modules; "
+            "roughsets_base.RoughSetDT; assert 'pandas' in sys.modules"
+        )
+
+    def test_import_of_submodules(self):
+        self.run_python(
+            "import roughsets_base; "
+            "assert roughsets_base.roughset_dt.RoughSetDT is roughsets_base.RoughSetDT; "
+            "roughsets_base.roughset_si, roughsets_base.roughset_mdt, roughsets_base.roughset_bootstrap"
+        )
+
+    def test_validate(self):
+        with pytest.raises(Exception):
+            RoughSetDT(self.X, self.y.iloc[1:])
+
+        with pytest.raises(ValueError):
+            RoughSetDT(self.X.rename(columns={"A1": "index"}), self.y)
+
+        rough_set = RoughSetDT(self.X, self.y, validate=False)
+        assert rough_set.get_dependency_degree() == self.rough_set.get_dependency_degree()
+
+    def test_get_subset_codes(self):
+        rough_set = RoughSetDT(self.X, self.y)
+        subset_codes = rough_set.get_subset_codes(["A2"])
+
+        assert (subset_codes == self.rough_set.get_codes()[:, [1]]).all()
+        assert (rough_set.get_subset_codes() == self.rough_set.get_codes()).all()
+
+    def test_prepare(self):
+        rough_set = RoughSetDT(self.X, self.y, prepare=True)
+
+        assert rough_set.get_codes().shape == self.X.shape
+        assert (rough_set.get_codes() == self.rough_set.get_codes()).all()
+        assert (rough_set.get_y_codes() == self.rough_set.get_y_codes()).all()
+
+        with pytest.raises(TypeError):
+            RoughSetDT(pd.DataFrame({"A1": [[1], [2]]}), pd.Series([1, 2]), prepare=True)
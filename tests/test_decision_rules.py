@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+
+from roughsets_base.roughset_dt import RoughSetDT
+from tests.abstract.t_roughset import AbstractClasses
+
+
+class TestDecisionRules(AbstractClasses.TBase):
+    """
+        Run tests of decision rules for dataset: 3
+
+    """
+
+    def setUp(self):
+        super().setUpDataSet(3)
+
+    def test_get_decision_rules(self):
+        rules = self.rough_set.get_decision_rules()
+
+        true_rules = pd.DataFrame({
+            "A1": ["A", "C", "A", "B", "A", "B"],
+            "A2": ["B", np.nan, "A", "B", "A", "B"],
+            "target": [2, 3, 1, 1, 2, 3],
+            "support": [1, 1, 1, 1, 1, 1],
+            "confidence": [1.0, 1.0, 0.5, 0.5, 0.5, 0.5],
+            "coverage": [0.5, 0.5, 0.5, 0.5, 0.5, 0.5],
+            "type": ["certain", "certain", "possible", "possible", "possible", "possible"]
+        })
+
+        assert rules[["A1", "target", "support", "type"]].equals(true_rules[["A1", "target", "support", "type"]])
+        assert rules["A2"].isna().tolist() == true_rules["A2"].isna().tolist()
+        assert rules["conditions"].tolist() == [("A1", "A2"), ("A1",)] + [("A1", "A2")] * 4
+        assert np.allclose(rules["confidence"], true_rules["confidence"])
+        assert np.allclose(rules["coverage"], true_rules["coverage"])
+
+    def test_get_decision_rules_without_value_reduction(self):
+        rules = self.rough_set.get_decision_rules(value_reduction=False)
+
+        assert len(rules.index) == 6
+        assert rules[["A1", "A2"]].notna().all().all()
+
+    def test_get_decision_rules_with_min_support(self):
+        X = pd.DataFrame({"a": [0, 0, 0, 1, 1, 2], "b": [0, 1, 0, 0, 1, 1]})
+        y = pd.Series([0, 0, 0, 1, 1, 1], name="d")
+        rough_set = RoughSetDT(X, y)
+
+        # Value reduction merges rules into: a=0 -> 0, a=1 -> 1, a=2 -> 1
+        rules = rough_set.get_decision_rules(min_support=2)
+
+        assert rules["a"].tolist() == [0, 1]
+        assert rules["b"].isna().all()
+        assert rules["support"].tolist() == [3, 2]
+        assert np.allclose(rules["coverage"], [1.0, 2 / 3])
+
+    def test_get_decision_rules_with_missing_values(self):
+        rough_set = RoughSetDT(pd.DataFrame({"a": [np.nan, np.nan, 1, 1], "b": [0, 1, 0, 1]}), pd.Series([0, 0, 1, 2], name="t"))
+
+        rules = rough_set.get_decision_rules()
+
+        # a = NaN is a condition of the first rule, b is not used
+        assert rules["conditions"].tolist() == [("a",), ("a", "b"), ("a", "b")]
+        assert rules["a"].isna().tolist() == [True, False, False]
+        assert rules["t"].tolist() == [0, 1, 2]
+        assert rules["support"].tolist() == [2, 1, 1]
+
+    def test_get_decision_rules_with_missing_decisions(self):
+        rough_set = RoughSetDT(pd.DataFrame({"a": [1, 1, 2, 3, 3]}), pd.Series([0, 1, np.nan, 1, np.nan], name="t"))
+
+        rules = rough_set.get_decision_rules()
+
+        assert rules["t"].notna().all()
+        assert rules["a"].tolist() == [3, 1, 1]
+        assert rules["type"].tolist() == ["certain", "possible", "possible"]
+        assert rules["support"].tolist() == [1, 1, 1]
+        assert np.allclose(rules["confidence"], [1.0, 0.5, 0.5])
@@ -0,0 +1,52 @@
+import pandas as pd
+
+from roughsets_base.roughset_mdt import RoughSetMDT
+from tests.abstract.t_roughset import AbstractClasses
+
+
+class TestMultipleDecisions(AbstractClasses.TBase):
+    """
+        Run tests of a decision table with multiple decisions for dataset: 3
+
+    """
+
+    def setUp(self):
+        super().setUpDataSet(3)
+
+        self.Y = pd.DataFrame({
+            "target": self.y,
+            "severity": ["low", "low", "high", "low", "high", "high"]
+        })
+        self.multiple_rough_set = RoughSetMDT(self.X, self.Y, ind_index_name="IND")
+
+    def test_get_approximation_indices(self):
+        approximations = self.multiple_rough_set.get_approximation_indices()
+
+        for target in self.Y.columns:
+            rough_set = self.multiple_rough_set.get_decision_table(target)
+            true_approximations = rough_set.get_approximation_indices()
+
+            for region, true_region in zip(approximations[target], true_approximations):
+                self.assert_check_eqality_of_2_dataframe_indices(region, true_region)
+
+    def test_get_approximation_indices_of_concepts(self):
+        approximations = self.multiple_rough_set.get_approximation_indices(
+            concepts={"target": [3]}, subset=["A1"]
+        )
+
+        true_approximations = self.rough_set.get_approximation_indices(concepts=[3], subset=["A1"])
+        for region, true_region in zip(approximations["target"], true_approximations):
+            self.assert_check_eqality_of_2_dataframe_indices(region, true_region)
+
+    def test_get_dependency_degrees(self):
+        degrees = self.multiple_rough_set.get_dependency_degrees()
+
+        assert degrees["target"] == self.rough_set.get_dependency_degree()
+        assert degrees["severity"] == self.multiple_rough_set.get_decision_table("severity").get_dependency_degree()
+
+    def test_get_contingency_tables(self):
+        tables = self.multiple_rough_set.get_contingency_tables()
+
+        assert tables["target"].sum().sum() == len(self.X.index)
+        assert tables["severity"].loc[0].to_dict() == {"low": 2, "high": 0}
+        assert tables["severity"].loc[1].to_dict() == {"low": 1, "high": 1}
@@ -0,0 +1,98 @@
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from roughsets_base.roughset_dt import RoughSetDT
+from roughsets_base.roughset_mdt import RoughSetMDT
+from roughsets_base.roughset_si import _get_group_index
+from tests.abstract.t_roughset import AbstractClasses
+
+
+class TestOutOfCore(AbstractClasses.TBase):
+    """
+        Run tests of indiscernibility relations computed on disk
+
+    """
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.X = pd.DataFrame({
+            "a": rng.integers(0, 1000, 20000),
+            "b": rng.normal(size=20000).round(1),
+            "c": rng.choice(["x", "y"], 20000)
+        })
+        self.y = pd.Series(rng.integers(0, 2, 20000), name="target")
+
+        self.rough_set = RoughSetDT(self.X, self.y)
+
+    def assert_same_partition(self, ind_index1, ind_index2):
+        classes_count = len(np.unique(ind_index1))
+        assert classes_count == len(np.unique(ind_index2))
+        assert classes_count == len(np.unique(_get_group_index(np.column_stack([ind_index1, ind_index2]))))
+
+    def test_get_indiscernibility_index_out_of_core(self):
+        for subset in [None, ["a"], ["b", "c"]]:
+            ind_index = self.rough_set.get_indiscernibility_index_out_of_core(
+                subset=subset, memory_limit=2 ** 16, chunk_size=3000
+            )
+
+            assert isinstance(ind_index, np.memmap)
+            self.assert_same_partition(ind_index, self.rough_set.get_indiscernibility_index(subset))
+
+    def test_get_indiscernibility_index_out_of_core_to_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "ind_index.bin")
+            ind_index = self.rough_set.get_indiscernibility_index_out_of_core(
+                subset=["a", "c"], memory_limit=2 ** 16, directory=directory, filename=filename
+            )
+            del ind_index
+
+            ind_index = np.memmap(filename, dtype=np.int64, mode="r")
+            self.assert_same_partition(ind_index, self.rough_set.get_indiscernibility_index(["a", "c"]))
+            del ind_index
+
+    def test_approximations_with_ind_index(self):
+        ind_index = self.rough_set.get_indiscernibility_index_out_of_core(subset=["a", "b"], memory_limit=2 ** 16)
+
+        regions = self.rough_set.get_approximation_indices(concepts=[1], ind_index=ind_index)
+        true_regions = self.rough_set.get_approximation_indices(concepts=[1], subset=["a", "b"])
+        for region, true_region in zip(regions, true_regions):
+            self.assert_check_eqality_of_2_dataframe_indices(region, true_region)
+
+        assert self.rough_set.get_dependency_degree(ind_index=ind_index) == \
+            self.rough_set.get_dependency_degree(subset=["a", "b"])
+
+        multiple_rough_set = RoughSetMDT(self.X, pd.DataFrame({"target": self.y}))
+        assert multiple_rough_set.get_dependency_degrees(ind_index=ind_index)["target"] == \
+            self.rough_set.get_dependency_degree(subset=["a", "b"])
+
+    def test_get_indiscernibility_index_out_of_core_of_special_values(self):
+        X = pd.DataFrame({
+            "a": [0.0, -0.0, np.nan, np.nan, 1.5, 1.5],
+            "b": ["x", "x", None, None, "y", "z"]
+        })
+        rough_set = RoughSetDT(X, pd.Series([1, 1, 1, 1, 1, 1]))
+
+        ind_index = rough_set.get_indiscernibility_index_out_of_core(memory_limit=1, chunk_size=4)
+
+        self.assert_same_partition(ind_index, rough_set.get_indiscernibility_index())
+        assert len(np.unique(ind_index)) == 4
+
+    def test_get_indiscernibility_index_out_of_core_of_empty_X(self):
+        rough_set = RoughSetDT(pd.DataFrame({"a": []}), pd.Series([], dtype="int64"))
+
+        ind_index = rough_set.get_indiscernibility_index_out_of_core()
+
+        assert isinstance(ind_index, np.memmap)
+        assert len(ind_index) == 0
+
+    def test_ind_index_of_wrong_length(self):
+        ind_index = self.rough_set.get_indiscernibility_index(["a"])[:-1]
+
+        with self.assertRaises(ValueError):
+            self.rough_set.get_dependency_degree(ind_index=ind_index)
+
+        with self.assertRaises(ValueError):
+            RoughSetMDT(self.X, pd.DataFrame({"target": self.y})).get_dependency_degrees(ind_index=ind_index)